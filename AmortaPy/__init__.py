@@ -6,11 +6,14 @@ from ._api import *
 
 __all__ = [
     'generate_amortization_table',
+    'generate_amortization_tables',
     'generate_amortization_schedule',
+    'generate_amortization_grid',
     'Amortization',
     'calculate_total_period_payment',
     'calculate_principal_and_interest_payment',
     'calculate_principal_payment',
     'calculate_interest_payment',
+    'calculate_total_interest_batch',
     'plot_stacked_bar_chart'
 ]
\ No newline at end of file
@@ -1,7 +1,12 @@
 """API Functions
 """
 from __future__ import annotations
-from .core._amortization import Amortization
+import numpy as np
+import pandas as pd
+
+from .core._amortization import Amortization, _resolve_repayment_frequency_periods
+from .core._amortization_functions import calculate_total_interest_batch, _calculate_total_period_payments
+from .core._constants import MONTHLY_PERIODS
 
 
 def generate_amortization_schedule(nominal_annual_interest_rate:float,
@@ -9,7 +14,8 @@ def generate_amortization_schedule(nominal_annual_interest_rate:float,
                                    years:int|float,
                                    repayment_frequency:str|int|float|None = None,
                                    interest_only_nominal_annual_interest_rate:float|None=None,
-                                   interest_only_years:int|float|None=None
+                                   interest_only_years:int|float|None=None,
+                                   dtype:type|np.dtype=np.float64
                                    ) -> Amortization:
     """Configure Amortization Schedule 
 
@@ -21,8 +27,46 @@ def generate_amortization_schedule(nominal_annual_interest_rate:float,
          Defaults to None. If None configured default will be used.
         interest_only_nominal_annual_interest_rate (float | None, optional): The quoted annual interest only interest rate eg `4.14` = `0.0414`. Defaults to None.
         interest_only_years (int | float | None, optional): The years at interest only. EG `1` or `1.0`. Defaults to None.
+        dtype (type | np.dtype, optional): Float dtype of the schedule money columns. Defaults to `np.float64`, `np.float32` halves the memory.
 
     Returns:
         Amortization: Instantiated Amortization instance
     """                                
-    return Amortization(nominal_annual_interest_rate, principal_amount, years, repayment_frequency, interest_only_nominal_annual_interest_rate, interest_only_years)
\ No newline at end of file
+    return Amortization(nominal_annual_interest_rate, principal_amount, years, repayment_frequency, interest_only_nominal_annual_interest_rate, interest_only_years, dtype)
+
+def generate_amortization_grid(nominal_annual_interest_rates:float|list[float]|np.ndarray,
+                               principal_amounts:int|float|list[int|float]|np.ndarray,
+                               years:int|float|list[int|float]|np.ndarray,
+                               repayment_frequency:str|int|float|None = None
+                               ) -> pd.DataFrame:
+    """Summarise every combination of interest rate, principal and years in one vectorized calculation.
+    Useful for sensitivity analysis without building an `Amortization` per scenario.
+
+    Args:
+        nominal_annual_interest_rates (float | list[float] | np.ndarray): nominal annual interest rates EG: `[0.0394, 0.0450]`
+        principal_amounts (int | float | list[int | float] | np.ndarray): The principal amounts `515000` or `[450000, 515000]`
+        years (int | float | list[int | float] | np.ndarray): The amortization years eg `30` or `[20, 25, 30]`
+        repayment_frequency (str | int | float | None, optional): repayment frequency, `monthly`|`12`, or `fortnightly`|`26`, or `weekly`|`52`.
+         Defaults to None. If None `monthly` will be used.
+
+    Returns:
+        pd.DataFrame: One row per scenario with the `total_payment_per_period` and `total_interest`
+    """
+    rf_periods = MONTHLY_PERIODS if repayment_frequency is None else _resolve_repayment_frequency_periods(repayment_frequency)
+
+    rates, principals, terms = (
+        grid.ravel() for grid in np.meshgrid(
+            np.atleast_1d(np.asarray(nominal_annual_interest_rates, dtype=np.float64)),
+            np.atleast_1d(np.asarray(principal_amounts, dtype=np.float64)),
+            np.atleast_1d(np.asarray(years, dtype=np.float64)),
+            indexing='ij'
+        )
+    )
+    return pd.DataFrame({
+        'nominal_annual_interest_rate': rates,
+        'principal_amount': principals,
+        'years': terms,
+        # Whole periods, the same as `calculate_total_interest_batch` and an `Amortization` schedule
+        'total_payment_per_period': _calculate_total_period_payments(principals, rates / rf_periods, np.trunc(terms * rf_periods)),
+        'total_interest': calculate_total_interest_batch(rates, principals, terms, rf_periods)
+    })
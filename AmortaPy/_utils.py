@@ -2,7 +2,13 @@ from __future__ import annotations
 
 """Helper utility functions
 """
+import os
+import sys
+from functools import lru_cache
 
+_PACKAGE_DIR = os.path.dirname(__file__) + os.sep
+
+@lru_cache(maxsize=4)
 def build_inline_css_style_sheet(css_file_path:str|bytes, encoding:str='utf-8') -> str|None:
     """Read a .CSS file and wrap it in inline CSS `<style> </style>`
 
@@ -17,4 +23,18 @@ def build_inline_css_style_sheet(css_file_path:str|bytes, encoding:str='utf-8')
         with open(css_file_path,encoding=encoding, mode='r') as file:
             return f"<style> {file.read()} </style>"
     except FileNotFoundError:
-        return None
\ No newline at end of file
+        return None
+
+def _find_stack_level() -> int:
+    """Find the `warnings.warn` stacklevel of the first frame outside the `AmortaPy` package, 
+    so a warning points at the user's call however deep in the package it is raised. Modelled on pandas' `find_stack_level`.
+
+    Returns:
+        int: The stacklevel to pass to `warnings.warn` from the calling function
+    """
+    frame = sys._getframe(1)
+    level = 1
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+        level += 1
+    return level
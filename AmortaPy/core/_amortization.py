@@ -5,15 +5,43 @@ Contains:
 
 """
 from __future__ import annotations
+import math
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing_extensions import Self
 
+import numpy as np
 import pandas as pd
 
-from ._constants import Constants as const
-from ._amortization_functions import generate_amortization_table, calculate_total_period_payment
+from ._constants import (
+    WEEKLY_PERIODS, WEEKLY_NAME, FORTNIGHTLY_PERIODS, FORTNIGHTLY_NAME, MONTHLY_PERIODS, MONTHLY_NAME,
+    VALID_REPAYMENT_PERIODS, VALID_REPAYMENT_NAMES, INPLACE, EXCEL_EXPORT_PATH, TEMPLATES_FOLDER
+)
+from ._amortization_functions import (
+    calculate_total_interest_batch, _build_schedule_vectorized, _cast_schedule_columns
+)
 from .._utils import build_inline_css_style_sheet
 from ._plots import plot_stacked_bar_chart
 
+# Repayment frequency lookups
+_NAME_BY_PERIODS = {
+    int(WEEKLY_PERIODS): WEEKLY_NAME.lower(),
+    int(FORTNIGHTLY_PERIODS): FORTNIGHTLY_NAME.lower(),
+    int(MONTHLY_PERIODS): MONTHLY_NAME.lower()
+}
+_PERIODS_BY_NAME = {
+    sys.intern(name.lower()): periods for name, periods in [
+        (WEEKLY_NAME, WEEKLY_PERIODS),
+        (FORTNIGHTLY_NAME, FORTNIGHTLY_PERIODS),
+        (MONTHLY_NAME, MONTHLY_PERIODS)
+    ]
+}
+_VALID_REPAYMENT_PERIODS_SET = frozenset(_NAME_BY_PERIODS)
+
+# Inline CSS for `Amortization._repr_html_`, read once at import
+_STYLE_SHEET = build_inline_css_style_sheet(f"{TEMPLATES_FOLDER}/styles.css")
+
 def repayment_frequency_name(repayment_frequency:int|float) -> str:
     """Return the repayment frequency name that corresponds to the number of periods.
 
@@ -26,14 +54,10 @@ def repayment_frequency_name(repayment_frequency:int|float) -> str:
     Returns:
         str: Repaymet Frequency Name in lower case
     """
-    if int(repayment_frequency) == const.WEEKLY_PERIODS: 
-        return const.WEEKLY_NAME.lower()
-    if int(repayment_frequency) == const.FORTNIGHTLY_PERIODS: 
-        return const.FORTNIGHTLY_NAME.lower()
-    if int(repayment_frequency) == const.MONTHLY_PERIODS: 
-        return const.MONTHLY_NAME.lower()
-    if int(repayment_frequency) not in const.VALID_REPAYMENT_PERIODS:
-         raise ValueError(f'Repayment Frequency must be one of `{const.VALID_REPAYMENT_PERIODS}`')       
+    name = _NAME_BY_PERIODS.get(int(repayment_frequency))
+    if name is None:
+        raise ValueError(f'Repayment Frequency must be one of `{VALID_REPAYMENT_PERIODS}`')
+    return name
 
 def repayment_frequency_periods(repayment_frequency:str) -> int: 
     """Get the number of peirods for the given str repayment_frequency type.
@@ -47,32 +71,119 @@ def repayment_frequency_periods(repayment_frequency:str) -> int:
     Returns:
         int: Repayment period values
     """
-    if repayment_frequency.lower() == const.WEEKLY_NAME.lower(): 
-        return const.WEEKLY_PERIODS
-    if repayment_frequency.lower() == const.FORTNIGHTLY_NAME.lower(): 
-        return const.FORTNIGHTLY_PERIODS
-    if repayment_frequency.lower() == const.MONTHLY_NAME.lower(): 
-        return const.MONTHLY_PERIODS
-    if repayment_frequency.lower() not in const.VALID_REPAYMENT_NAMES:
-        raise ValueError(f'Repayment Frequency must be one of `{const.VALID_REPAYMENT_NAMES}`')
+    periods = _PERIODS_BY_NAME.get(repayment_frequency.lower())
+    if periods is None:
+        raise ValueError(f'Repayment Frequency must be one of `{VALID_REPAYMENT_NAMES}`')
+    return periods
+
+def _resolve_repayment_frequency_periods(repayment_frequency:str|int|float) -> int:
+    """Get and validate the repayment periods for a frequency given as a name or number of periods.
+
+    Args:
+        repayment_frequency (str | int | float): `monthly`|`12`, or `fortnightly`|`26`, or `weekly`|`52`
+
+    Raises:
+        ValueError: If repayment frequency is not valid
+
+    Returns:
+        int: Repayment Frequency periods
+    """
+    if isinstance(repayment_frequency, str):
+        return repayment_frequency_periods(repayment_frequency)
+    periods = int(repayment_frequency)
+    if periods not in _VALID_REPAYMENT_PERIODS_SET:
+        raise ValueError(f'Repayment Frequency must be one of `{VALID_REPAYMENT_PERIODS}`')
+    return periods
+
+def _validate_interest_only_terms(interest_only_nominal_annual_interest_rate:float, interest_only_years:int|float) -> None:
+    """Check the interest only rate and years of an `Amortization` are either both set or both unset.
+
+    Args:
+        interest_only_nominal_annual_interest_rate (float): The interest only nominal annual interest rate
+        interest_only_years (int | float): The years at interest only
+
+    Raises:
+        ValueError: If only one of the interest only rate and years is set
+    """
+    if (interest_only_nominal_annual_interest_rate > 0.00) != (interest_only_years > 0):
+        raise ValueError("To calculate interest only, you need to pass valid args to `interest_only_nominal_annual_interest_rate` and `interest_only_years`")
+
+@lru_cache(maxsize=128)
+def _build_cached_schedule(rate_per_period:float,
+                           principal_amount:int|float,
+                           n_periods:int,
+                           interest_only_rate_per_period:float,
+                           n_interest_only_periods:int) -> tuple[dict[str, np.ndarray], float, float]:
+    """Build the minimum repayment schedule for the loan terms, memoised so recently seen terms are shared by every instance.
+
+    Args:
+        rate_per_period (float): Nominal interest rate per period
+        principal_amount (int | float): The principal amount
+        n_periods (int): Number of periods
+        interest_only_rate_per_period (float): Interest only rate per period
+        n_interest_only_periods (int): Number of interest only periods
+
+    Returns:
+        tuple[dict[str, np.ndarray], float, float]: (`columns`, `total_interest`, `PMT`) from `_build_schedule_vectorized`, with read only columns
+    """
+    columns, total_interest, pmt = _build_schedule_vectorized(
+        rate_per_period,
+        principal_amount,
+        n_periods,
+        interest_only_rate_per_period=interest_only_rate_per_period,
+        number_of_interest_only_periods=n_interest_only_periods
+    )
+    # Shared between instances, freeze them
+    for values in columns.values():
+        values.flags.writeable = False
+    return columns, total_interest, pmt
 
 class Amortization:
     """Amortization Schedule Calculator
     """
-    _repayment_frequency_periods:int = const.MONTHLY_PERIODS
-    _nominal_annual_interest_rate: float
-    _principal_amount: int|float
+    __slots__ = (
+        '_nominal_annual_interest_rate',
+        '_principal_amount',
+        '_years',
+        '_repayment_frequency_periods',
+        '_interest_only_nominal_annual_interest_rate',
+        '_interest_only_years',
+        '_dtype',
+        '_arrays',
+        '_df_cache',
+        '_cached_n_periods',
+        '_cached_n_io_periods',
+        '_cached_pmt',
+        '_cached_total_interest',
+        '_cached_repayment_frequency_name',
+        '_cached_rate_per_period'
+    )
+    # Loan terms, read only outside the `set_*` methods so the schedule is always regenerated
+    _repayment_frequency_periods:int
+    _nominal_annual_interest_rate:float
+    _principal_amount:int|float
     _years:int|float
-    _interest_only_nominal_annual_interest_rate:float = 0.00
-    _interest_only_years:int|float = 0.00
-    _df: pd.DataFrame
+    _interest_only_nominal_annual_interest_rate:float
+    _interest_only_years:int|float
+    # Float dtype of the schedule money columns
+    _dtype:np.dtype
+    _arrays: dict[str, np.ndarray]
+    _df_cache: pd.DataFrame|None
+    # Derived values, refreshed by `_generate_amortization_schedule`
+    _cached_n_periods:int
+    _cached_n_io_periods:int
+    _cached_pmt:float
+    _cached_total_interest:float
+    _cached_repayment_frequency_name:str
+    _cached_rate_per_period:float
 
     def __init__(self,
                  nominal_annual_interest_rate:float,
                  principal_amount:int|float, years:int|float,
                  repayment_frequency:str|int|float|None = None,
                  interest_only_nominal_annual_interest_rate:float|None=None,
-                 interest_only_years:int|float|None=None ) -> None:
+                 interest_only_years:int|float|None=None,
+                 dtype:type|np.dtype=np.float64 ) -> None:
         """Configure Amortization Schedule 
 
         Args:
@@ -83,17 +194,26 @@ class Amortization:
              Defaults to None. If None configured default will be used.
             interest_only_nominal_annual_interest_rate (float | None, optional): The quoted annual interest only interest rate eg `4.14` = `0.0414`.
              Defaults to None.
-            interest_only_years (int | float | None, optional): The years at interest only. EG `1` or `1.0`. Defaults to None.
+            interest_only_years (int | float | None, optional): The years at interest only. EG `1` or `1.0`. Defaults to None. 
+             Truncated to whole repayment periods, a term under one period has no interest only periods.
+            dtype (type | np.dtype, optional): Float dtype of the schedule money columns. Defaults to `np.float64`. 
+             `np.float32` halves the memory of the schedule, warning if a closing balance moves by more than a cent.
+
+        Raises:
+            ValueError: If only one of `interest_only_nominal_annual_interest_rate` and `interest_only_years` is set
         """
+        _validate_interest_only_terms(interest_only_nominal_annual_interest_rate or 0.0, interest_only_years or 0.0)
+        self._repayment_frequency_periods = MONTHLY_PERIODS
+        self._dtype = np.dtype(dtype)
+        self._df_cache = None
         self._nominal_annual_interest_rate = nominal_annual_interest_rate
         self._years = years
         self._principal_amount = principal_amount
         self._interest_only_nominal_annual_interest_rate = interest_only_nominal_annual_interest_rate or 0.0
         self._interest_only_years = interest_only_years or 0.0
         if repayment_frequency is not None:
-            self.set_repayment_frequency_periods(repayment_frequency)
-        else:
-            self._generate_amortization_schedule()
+            self._repayment_frequency_periods = self._get_repayment_frequency_periods(repayment_frequency)
+        self._generate_amortization_schedule()
 
     # Getters
     @property
@@ -103,14 +223,14 @@ class Amortization:
         Returns:
             Int: Total Peirods
         """
-        return self.calculate_total_number_of_periods(self.years, self.repayment_frequency_periods)
+        return self._cached_n_periods
 
     @property
     def repayment_frequency_name(self) -> str:
         """The repayment frequency name.
         eg: `weekly`, `fortnightly`, or `monthly`
         """
-        return repayment_frequency_name(self._repayment_frequency_periods)
+        return self._cached_repayment_frequency_name
     
     @property
     def repayment_frequency_periods(self) -> int:
@@ -135,12 +255,28 @@ class Amortization:
         """Current Loan Term Years
         """
         return self._years
-    
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Float dtype of the schedule money columns"""
+        return self._dtype
+
     @property
     def amortization_schedule(self) -> pd.DataFrame:
-        """Amortization Repayment Schedule as `Pandas.DataFrame`
+        """Amortization Repayment Schedule as `Pandas.DataFrame`. 
+        Built from the schedule arrays on first access after each schedule generation.
+        """
+        if self._df_cache is None:
+            # Copied, the schedule arrays may be shared with other instances
+            self._df_cache = pd.DataFrame(self._arrays)
+        return self._df_cache
+
+    @property
+    def amortization_arrays(self) -> MappingProxyType[str, np.ndarray]:
+        """Read only view of the amortization schedule columns as `numpy` arrays, keyed by the `amortization_schedule` column names. 
+        Use it when the `DataFrame` isn't needed, the arrays are shared with copies of the instance so treat them as read only.
         """
-        return self._df
+        return MappingProxyType(self._arrays)
 
     @property
     def effective_annual_interest_rate(self) -> float:
@@ -156,25 +292,26 @@ class Amortization:
         Returns:
             float: `EAR`
         """
-        return ((1 + (self._nominal_annual_interest_rate/self._repayment_frequency_periods))**self._repayment_frequency_periods) - 1
+        # `expm1(n*log1p(i/n))` avoids the cancellation of `(1 + i/n)**n - 1` for small `i/n`
+        return math.expm1(self._repayment_frequency_periods * math.log1p(self._cached_rate_per_period))
 
     @property
     def total_interest(self) ->float:
         """Calculated total interest payable under the current amortization scheduled.
         """
-        return self._df['interest'].sum()
+        return self._cached_total_interest
 
     @property
     def total_outstanding_balance(self) -> float:
         """Calculated total outstanding balance (principal + interest) under the current amortization scheduled.
         """
-        return self.principal_amount + self.total_interest
+        return self._principal_amount + self.total_interest
 
     @property
     def total_interest_over_principal_per_cent(self) -> float:
         """Total Interest Payable over Total Principal - Under the current amortization schedule
         """
-        return self.total_interest/self.principal_amount
+        return self.total_interest/self._principal_amount
     
     @property
     def total_payment_per_period(self) -> float:
@@ -183,20 +320,17 @@ class Amortization:
         Returns:
             float: Total Payment Per Peirod `PMT` (Principal + Interest)
         """
-        return calculate_total_period_payment(
-            self.principal_amount,
-            self.nominal_annual_interest_rate/self.repayment_frequency_periods,
-            self.n_periods - self.n_interest_only_periods
-        )
+        return self._cached_pmt
     
     @property
     def period_balances_chart(self):
         """Plot Amortization Peirod Balances Principal and Interest in a Stacked Bar Chart.
         """
-        df  = self.amortization_schedule.rename(
-            columns={'opening_balance' : 'Outstanding Principal ($)', 'cumulative_interest' : 'Cumulative Interest Paybale ($)', 'period': 'Period'}, 
-            inplace=False
-        )
+        data = {
+            'Period': self._arrays['period'],
+            'Outstanding Principal ($)': self._arrays['opening_balance'],
+            'Cumulative Interest Paybale ($)': self._arrays['cumulative_interest']
+        }
 
         chart_layout = {
             'title': 'Amortization Period Balances Over Time (n)',
@@ -204,31 +338,31 @@ class Amortization:
             'yaxis_title':'Peirod Payments ($)',
             'legend_title':'Legend'
         }
-        return plot_stacked_bar_chart(df, 'Period', [ 'Outstanding Principal ($)', 'Cumulative Interest Paybale ($)'], chart_layout)
+        return plot_stacked_bar_chart(data, 'Period', [ 'Outstanding Principal ($)', 'Cumulative Interest Paybale ($)'], chart_layout)
 
     @property
     def period_repayments_chart(self):
         """Plot Amortization Repayments Principal and Interest in a Stacked Bar Chart 
         """
-        df  = self.amortization_schedule.rename(
-            columns={'principal':'Principal Payment ($)', 'interest':'Interest Payment ($)', 'period': 'Period'}, 
-            inplace=False
-        )
+        data = {
+            'Period': self._arrays['period'],
+            'Principal Payment ($)': self._arrays['principal'],
+            'Interest Payment ($)': self._arrays['interest']
+        }
         chart_layout = {
             'title': 'Amortization Period Repayments Over Time (n)',
             'xaxis_title':'n - Number of Repayment Periods',
             'yaxis_title':'Peirod Payments ($)',
             'legend_title':'Legend'
         }
-        return plot_stacked_bar_chart(df, 'Period', ['Principal Payment ($)', 'Interest Payment ($)'], chart_layout)
+        return plot_stacked_bar_chart(data, 'Period', ['Principal Payment ($)', 'Interest Payment ($)'], chart_layout)
 
     @property
     def has_interest_only(self) -> bool:
         """Is proportion of the amortization schedule interest only.
         """
-        if self._interest_only_nominal_annual_interest_rate > 0.0 and self._interest_only_years > 0:
-            return True
-        return False
+        # The rate and years are validated together, an interest only term under one period has no interest only periods
+        return self._cached_n_io_periods > 0
     
     @property
     def interest_only_years(self) -> int|float:
@@ -243,22 +377,22 @@ class Amortization:
     @property
     def n_interest_only_periods(self) -> int:
         """Number of interest only periods in the amortization schedule"""
-        return self.calculate_total_number_of_periods(self.interest_only_years, self.repayment_frequency_periods)
+        return self._cached_n_io_periods
 
     @property
     def interest_only_payment_per_period(self) -> float:
         """Interest only payment per period"""
         if not self.has_interest_only:
             return 0.00
-        return self.principal_amount * self.interest_only_nominal_annual_interest_rate / self.repayment_frequency_periods
+        return self._principal_amount * self._interest_only_nominal_annual_interest_rate / self._repayment_frequency_periods
 
     @property 
     def total_interest_only_payments(self) -> float:
         """Total Interest payable over the interest only periods"""
-        return self.interest_only_payment_per_period * self.repayment_frequency_periods * self.interest_only_years
+        return self.interest_only_payment_per_period * self._cached_n_io_periods
     
     # Setters
-    def set_repayment_frequency_periods(self, repayment_frequency:str|int|float, inplace:bool = const.INPLACE) -> Amortization | Self:
+    def set_repayment_frequency_periods(self, repayment_frequency:str|int|float, inplace:bool = INPLACE) -> Amortization | Self:
         """Set/Update/Change the current repayment frequency peirods.
 
         Args:
@@ -268,12 +402,14 @@ class Amortization:
         Returns:
             LoanAmortization | Self
         """
-        if inplace:
-            self._repayment_frequency_periods = self._get_repayment_frequency_periods(repayment_frequency)
-            return self._generate_amortization_schedule()
-        return self.copy().set_repayment_frequency_periods(repayment_frequency, inplace=True)
+        target = self if inplace else self._shallow_copy()
+        repayment_frequency_periods = target._get_repayment_frequency_periods(repayment_frequency)
+        if repayment_frequency_periods == target._repayment_frequency_periods:
+            return target
+        target._repayment_frequency_periods = repayment_frequency_periods
+        return target._generate_amortization_schedule()
         
-    def set_years(self, years:int|float, inplace:bool = const.INPLACE) -> Amortization | Self:
+    def set_years(self, years:int|float, inplace:bool = INPLACE) -> Amortization | Self:
         """Update the loan years
 
         Args:
@@ -283,12 +419,13 @@ class Amortization:
         Returns:
             LoanAmortization | Self
         """
-        if inplace:
-            self._years = years
-            return self._generate_amortization_schedule()
-        return self.copy().set_years(years, inplace=True)
+        target = self if inplace else self._shallow_copy()
+        if years == target._years:
+            return target
+        target._years = years
+        return target._generate_amortization_schedule()
 
-    def set_nominal_annual_interest_rate(self, nominal_annual_interest_rate:float, inplace:bool = const.INPLACE) -> Amortization | Self:
+    def set_nominal_annual_interest_rate(self, nominal_annual_interest_rate:float, inplace:bool = INPLACE) -> Amortization | Self:
         """Update the Nominal Annual Interest Rate and recalculate loan
 
         Args:
@@ -298,27 +435,34 @@ class Amortization:
         Returns:
             LoanAmortization | Self 
         """
-        if inplace:
-            self._nominal_annual_interest_rate = nominal_annual_interest_rate
-            return self._generate_amortization_schedule()
-        return self.copy().set_nominal_annual_interest_rate(nominal_annual_interest_rate, True)
+        target = self if inplace else self._shallow_copy()
+        if nominal_annual_interest_rate == target._nominal_annual_interest_rate:
+            return target
+        target._nominal_annual_interest_rate = nominal_annual_interest_rate
+        return target._generate_amortization_schedule()
 
-    def set_interest_only(self, interest_only_nominal_annual_interest_rate:float, interest_only_years:int|float, inplace:bool = const.INPLACE) -> Amortization | Self:
+    def set_interest_only(self, interest_only_nominal_annual_interest_rate:float, interest_only_years:int|float, inplace:bool = INPLACE) -> Amortization | Self:
         """Update the interest only portions of the amortization schedule.
 
         Args:
             interest_only_nominal_annual_interest_rate (float): Nominal annual interest rate for interest only
-            interest_only_years (int | float): Loan Repayment Years
+            interest_only_years (int | float): Loan Repayment Years at interest only, truncated to whole repayment periods
             inplace (bool, optional): Wether to update the instance or return new instance. Defaults to True, Updates Instance.
 
+        Raises:
+            ValueError: If only one of `interest_only_nominal_annual_interest_rate` and `interest_only_years` is set
+
         Returns:
             LoanAmortization | Self
         """
-        if inplace:
-            self._interest_only_nominal_annual_interest_rate = interest_only_nominal_annual_interest_rate
-            self._interest_only_years = interest_only_years
-            return self._generate_amortization_schedule()
-        return self.copy().set_interest_only(interest_only_nominal_annual_interest_rate,interest_only_years, inplace=True)
+        _validate_interest_only_terms(interest_only_nominal_annual_interest_rate, interest_only_years)
+        target = self if inplace else self._shallow_copy()
+        if (interest_only_nominal_annual_interest_rate == target._interest_only_nominal_annual_interest_rate 
+            and interest_only_years == target._interest_only_years):
+            return target
+        target._interest_only_nominal_annual_interest_rate = interest_only_nominal_annual_interest_rate
+        target._interest_only_years = interest_only_years
+        return target._generate_amortization_schedule()
 
     # Private Methods
     def _get_repayment_frequency_periods(self, repayment_frequency:str|int|float|None) -> int:
@@ -328,51 +472,41 @@ class Amortization:
             repayment_frequency (str | int | float | None): The loan term repayment frequency. Defaults to None. 
             Will use instance repayment frequency if None
 
+        Raises:
+            ValueError: If repayment frequency is not valid
+
         Returns:
             int: Repayment Frequency periods 
         """
         if repayment_frequency is None:
             return self._repayment_frequency_periods
-        if isinstance(repayment_frequency, str):
-            return repayment_frequency_periods(repayment_frequency)
-        if repayment_frequency_name(repayment_frequency):
-            return int(repayment_frequency)
+        return _resolve_repayment_frequency_periods(repayment_frequency)
 
-    def _nominal_interest_rate_per_period(self, nominal_annual_interest_rate:float, repayment_frequency:int|str|None = None) -> float:
-        """The Nominal Annual Interest Rate divided by the number of peirods in the repayment frequency
-
-        Args:
-            nominal_annual_interest_rate (float): Nominal Annual Interest Rate expressed a `decimal` not as a `percent`. eg. `4.00%` = `0.04` and `4.65%` = `0.0465`.
-            repayment_frequency (int | str | None, optional): [`monthly` | `12`, `fortnightly` | `26`, or `weekly` | `52` ]. Defaults to None. If None will use default `cls.repayment_frequency`
+    def _generate_amortization_schedule(self) -> Amortization | Self:
+        """Generate the Amortization Loan Repayment Schedule from the current loan terms.
+        Stores the schedule arrays and caches the derived values read by the properties, 
+        including the `PMT` and total interest returned by the schedule builder, so no property reads back from the DataFrame.
+        Schedules for recently seen loan terms are reused from `_build_cached_schedule` rather than rebuilt.
 
         Returns:
-            float: The Nominal Annual Interest Rate divided by the number of peirods in the repayment frequency
-            Example: `0.0394 / 12` -> `0.003283333333333333`
+            Amortization | Self
         """
-        return nominal_annual_interest_rate / self._get_repayment_frequency_periods(repayment_frequency)
-
-    def _generate_amortization_schedule(self):
-        """Generate an Amortization Loan Repayment Schedule
-
-        Args:
-            nominal_annual_interest_rate (float): Nominal Annual Interest Rate expressed a `decimal` not as a `percent`. eg. `4.00%` = `0.04` and `4.65%` = `0.0465`.
-            loan_amount (int | float): The amount being loaned expressed as a `int` or `float` eg: `$500,000` = `5e5` or `500000` or `500000.00`.
-            years (int): number of years the loan is for. EG `30` years.
-            repayment_frequency (int | str | None, optional): The repayment frequency of the loan, expressed as int or str:
-            [( `12` or  `Monthly`) or (`26` or `Fortnightly`) (`52` or `Weekly`)].
-            \t*Defaults to `None`. If `None`, by default will use `Loan.repayment_frequency`
-
-        Returns:
-            pd.DataFrame: The Loan Amortization Schedule of repayments in order of repayment
-        """
-        df = generate_amortization_table(
-            self._nominal_interest_rate_per_period(self.nominal_annual_interest_rate, self.repayment_frequency_periods),
-            self.principal_amount,
-            self.n_periods,
-            interest_only_rate_per_period=self._nominal_interest_rate_per_period(self.interest_only_nominal_annual_interest_rate, self.repayment_frequency_periods),
-            number_of_interest_only_periods=self.n_interest_only_periods
+        # The frequency is validated when set, read it once and derive the terms inline
+        rfp = self._repayment_frequency_periods
+        self._cached_repayment_frequency_name = repayment_frequency_name(rfp)
+        self._cached_n_periods = n_periods = int(self._years * rfp)
+        self._cached_n_io_periods = n_io_periods = int(self._interest_only_years * rfp)
+        self._cached_rate_per_period = rate_per_period = self._nominal_annual_interest_rate / rfp
+        # A term under one period truncates to no interest only periods, so no interest only rate either
+        interest_only_rate_per_period = self._interest_only_nominal_annual_interest_rate / rfp if n_io_periods > 0 else 0.0
+
+        arrays, total_interest, pmt = _build_cached_schedule(
+            rate_per_period, self._principal_amount, n_periods, interest_only_rate_per_period, n_io_periods
         )
-        self._df = df
+        self._arrays = _cast_schedule_columns(arrays, self._dtype)
+        self._df_cache = None
+        self._cached_total_interest = total_interest
+        self._cached_pmt = pmt
         return self
     
     # Public Methods
@@ -388,11 +522,41 @@ class Amortization:
         """
         return years * self._get_repayment_frequency_periods(repayment_frequency)
 
-    def export_amortization_schedule_to_excel(self, export_path:str|bytes = const.EXCEL_EXPORT_PATH, engine:str = 'openpyxl'):
+    @staticmethod
+    def calculate_total_interest(nominal_annual_interest_rate:float,
+                                 principal_amount:int|float, years:int|float,
+                                 repayment_frequency:str|int|float|None = None,
+                                 interest_only_nominal_annual_interest_rate:float|None=None,
+                                 interest_only_years:int|float|None=None ) -> float:
+        """Calculate the total interest payable on the loan terms without building an amortization schedule. 
+        Scalar form of `calculate_total_interest_batch`, the closed form `n*PMT - P` over the amortizing periods, plus the interest only payments.
+
+        Args:
+            nominal_annual_interest_rate (float): nominal annual interest rate EG: `3.94%` = `0.0394`
+            principal_amount (int | float): The principal amount `515000` or `515000.00`
+            years (int | float): The amortization years eg `30` or `30.0`
+            repayment_frequency (str | int | float | None, optional): repayment frequency, `monthly`|`12`, or `fortnightly`|`26`, or `weekly`|`52`.
+             Defaults to None. If None `monthly` will be used.
+            interest_only_nominal_annual_interest_rate (float | None, optional): The quoted annual interest only interest rate eg `4.14` = `0.0414`. Defaults to None.
+            interest_only_years (int | float | None, optional): The years at interest only. EG `1` or `1.0`. Defaults to None.
+
+        Raises:
+            ValueError: If only one of `interest_only_nominal_annual_interest_rate` and `interest_only_years` is set
+
+        Returns:
+            float: Total interest payable, matches `total_interest` of an `Amortization` with the same terms
+        """
+        rfp = MONTHLY_PERIODS if repayment_frequency is None else _resolve_repayment_frequency_periods(repayment_frequency)
+        return float(calculate_total_interest_batch(
+            nominal_annual_interest_rate, principal_amount, years, rfp,
+            interest_only_nominal_annual_interest_rate, interest_only_years
+        ))
+
+    def export_amortization_schedule_to_excel(self, export_path:str|bytes = EXCEL_EXPORT_PATH, engine:str = 'openpyxl'):
         """Export the amortization table dataframe to excel.
 
         Args:
-            export_path (str | bytes | None, optional): Excel file export path. Defaults to const.EXCEL_EXPORT_PATH.
+            export_path (str | bytes | None, optional): Excel file export path. Defaults to EXCEL_EXPORT_PATH.
             engine (str, optional): Write engine to use, `openpyxl` or `xlsxwriter`. Defaults to 'openpyxl'.
         """
         self.amortization_schedule.to_excel(export_path, index=False, engine=engine)
@@ -403,15 +567,22 @@ class Amortization:
         Returns:
             LoanAmortization: New instantiated version of object 
         """
-        return Amortization(
-            self.nominal_annual_interest_rate,
-            self.principal_amount,
-            self.years,
-            self.repayment_frequency_periods,
-            self.interest_only_nominal_annual_interest_rate,
-            self.interest_only_years
-        )
+        return self._shallow_copy()._generate_amortization_schedule()
     
+    def _shallow_copy(self) -> Amortization:
+        """Copy the instance state without running `__init__` or regenerating the schedule. 
+        Schedule arrays are shared, so only use it ahead of regenerating the schedule.
+
+        Returns:
+            Amortization: New instance sharing this instance's state
+        """
+        obj = object.__new__(Amortization)
+        for name in Amortization.__slots__:
+            setattr(obj, name, getattr(self, name, None))
+        # The memoised DataFrame is per instance, the copy builds its own
+        obj._df_cache = None
+        return obj
+
     def __copy__(self) -> Amortization:
         """Shallow Copy
 
@@ -435,28 +606,31 @@ class Amortization:
         if not self.has_interest_only:
             return None
 
+        total_interest_only = self.total_interest_only_payments
         report = f"""----
         Interest Only Repayments Per Peirod:    ${self.interest_only_payment_per_period :0,.2f}
-        Interest Only Annual Interest Rate:     {self.interest_only_nominal_annual_interest_rate * 100 :0.2f}%   
-        Forecasted Total Interest Only:         ${self.total_interest_only_payments :0,.2f}
-        Total Interest Only / Total Interest:   {self.total_interest_only_payments/self.total_interest * 100 :0.2f}%
+        Interest Only Annual Interest Rate:     {self._interest_only_nominal_annual_interest_rate * 100 :0.2f}%   
+        Forecasted Total Interest Only:         ${total_interest_only :0,.2f}
+        Total Interest Only / Total Interest:   {total_interest_only/self.total_interest * 100 :0.2f}%
         """
         return report
 
     def __repr__(self) -> str:
         interest_only_repr = self._repr_interest_only()
+        principal_amount = self._principal_amount
+        total_interest = self.total_interest
         report = f"""
         --------------------------------------------------------------------
         Amortization Schedule
         --------------------------------------------------------------------
-        Principal Borrowed:                     ${self.principal_amount :0,.2f}
-        Years:                                  {self.years}
-        Annual Interest Rate:                   {self.nominal_annual_interest_rate*100 :0.2f}%
-        Forecasted Total Interest:              ${self.total_interest :0,.2f}
+        Principal Borrowed:                     ${principal_amount :0,.2f}
+        Years:                                  {self._years}
+        Annual Interest Rate:                   {self._nominal_annual_interest_rate*100 :0.2f}%
+        Forecasted Total Interest:              ${total_interest :0,.2f}
         Repayment Frequency:                    {self.repayment_frequency_name.title()} - {self.n_periods :0,.0f} Periods 
         Minimum Repayments Per Peirod:          ${self.total_payment_per_period :0,.2f}
         Effective Annual Interest Rate (EAR)    {self.effective_annual_interest_rate * 100 :0.2f}%         
-        Total Interest / Total Principal:       {self.total_interest_over_principal_per_cent * 100 :0.2f}%
+        Total Interest / Total Principal:       {total_interest/principal_amount * 100 :0.2f}%
         {interest_only_repr if interest_only_repr else ''}
         --------------------------------------------------------------------
         """ 
@@ -466,6 +640,7 @@ class Amortization:
         if not self.has_interest_only:
             return None
 
+        total_interest_only = self.total_interest_only_payments
         report = f"""
             <tr>
                 <th>Interest Repayments Per Peirod</th>
@@ -475,19 +650,20 @@ class Amortization:
             </tr>
             <tr>
                 <td>${self.interest_only_payment_per_period :0,.2f}</td>
-                <td>{self.interest_only_nominal_annual_interest_rate * 100 :0.2f}%</td>              
-                <td>${self.total_interest_only_payments :0,.2f}</td>
-                <td>{self.total_interest_only_payments/self.total_interest * 100 :0.2f}%</td>
+                <td>{self._interest_only_nominal_annual_interest_rate * 100 :0.2f}%</td>              
+                <td>${total_interest_only :0,.2f}</td>
+                <td>{total_interest_only/self.total_interest * 100 :0.2f}%</td>
             </tr>
         """
         return report
 
 
     def _repr_html_(self):
-        style_sheet = build_inline_css_style_sheet(f"{const.TEMPLATES_FOLDER}/styles.css")
         interest_only_repr = self._repr_interest_only_html()
+        principal_amount = self._principal_amount
+        total_interest = self.total_interest
         report = f"""
-        {style_sheet if style_sheet else ''}
+        {_STYLE_SHEET if _STYLE_SHEET else ''}
         <h1>Amortization Schedule</h1>
         <table class='amort-summary'>
             <tr>
@@ -497,10 +673,10 @@ class Amortization:
                 <th>Forecasted Total Interest</th>
             </tr>
             <tr>
-                <td>${self.principal_amount :0,.2f}</td>
-                <td>{self.years}</td>
-                <td>{self.nominal_annual_interest_rate*100 :0.2f}%</td>
-                <td>${self.total_interest :0,.2f}</td>
+                <td>${principal_amount :0,.2f}</td>
+                <td>{self._years}</td>
+                <td>{self._nominal_annual_interest_rate*100 :0.2f}%</td>
+                <td>${total_interest :0,.2f}</td>
             </tr>
             <tr>
                 <th>Repayment Frequency</th>
@@ -512,7 +688,7 @@ class Amortization:
                 <td>{self.repayment_frequency_name.title()} - {self.n_periods :0,.0f} Periods</td> 
                 <td>${self.total_payment_per_period :0,.2f}</td>
                 <td>{self.effective_annual_interest_rate * 100 :0.2f}%</td>              
-                <td>{self.total_interest_over_principal_per_cent * 100 :0.2f}%</td>
+                <td>{total_interest/principal_amount * 100 :0.2f}%</td>
             </tr>
             {interest_only_repr if interest_only_repr else ''}
         </table>
@@ -1,8 +1,86 @@
 from __future__ import annotations
-from argparse import ArgumentError
+import math
+import warnings
 
+import numpy as np
 import pandas as pd
 
+from .._utils import _find_stack_level
+
+# Amortization loop and fused closed form schedule kernels: Cython extension, then numba JIT, 
+# then the pure Python loop and numpy passes below. numba is only imported, and JIT compiled, without the extension
+try:
+    from ._loan_kernel import amortize_kernel as _amortize_kernel, closed_form_schedule_kernel as _closed_form_schedule_kernel
+except ImportError:
+    try:
+        from ._amortization_functions_nb import _amortize_kernel, _closed_form_schedule_kernel
+    except ImportError:
+        _amortize_kernel = None
+        _closed_form_schedule_kernel = None
+
+def _reverse_cumulative_sum(values:np.ndarray) -> np.ndarray:
+    """Sum from the last period back to each period, EG the interest still payable from each period onwards.
+
+    Args:
+        values (np.ndarray): Period values in order of repayment along the last axis
+
+    Returns:
+        np.ndarray: Reverse cumulative sum, in order of repayment
+    """
+    # Both flips are views, the cumsum is the only pass and allocation. `total - cumsum + values` 
+    # takes three more passes and loses the small tail sums to cancellation
+    return np.cumsum(values[..., ::-1], axis=-1)[..., ::-1]
+
+def _growth_factors_minus_one(nominal_interest_rate_per_period:float|np.ndarray, stop:int, start:int=0) -> np.ndarray:
+    """Calculate the `(1+r)^k - 1` growth factors for `k = start..stop-1` as `expm1(k*log1p(r))`, 
+    which keeps the precision of small period rates that `1 + r` rounds away.
+
+    Args:
+        nominal_interest_rate_per_period (float | np.ndarray): The interest rate per peirod, a `(loans, 1)` column for a factor row per loan
+        stop (int): One past the last exponent
+        start (int, optional): First exponent. Defaults to 0.
+
+    Returns:
+        np.ndarray: Growth factors less one, one per exponent along the last axis
+    """
+    # Float exponents from the start, then scaled and exponentiated in place in the one buffer
+    factors = np.multiply(np.arange(start, stop, dtype=np.float64), np.log1p(nominal_interest_rate_per_period))
+    return np.expm1(factors, out=factors)
+
+def _cast_schedule_columns(columns:dict[str, np.ndarray], dtype:type|np.dtype) -> dict[str, np.ndarray]:
+    """Cast the money columns of a schedule to `dtype`, leaving `period` as integers.
+
+    Args:
+        columns (dict[str, np.ndarray]): Schedule columns calculated in float64
+        dtype (type | np.dtype): Float dtype to store the columns as EG `np.float32`
+
+    Returns:
+        dict[str, np.ndarray]: The cast columns, `columns` itself when `dtype` is float64
+    """
+    dtype = np.dtype(dtype)
+    if dtype == np.float64:
+        return columns
+    cast = {name: values if name == 'period' else values.astype(dtype) for name, values in columns.items()}
+    # Narrower floats lose the cents on large balances. float32 values are $0.03125 apart above $262,144, 
+    # so essentially any realistic mortgage warns, EG out by ~$0.016 at $515,000
+    error = float(np.max(np.abs(cast['closing_balance'] - columns['closing_balance']), initial=0.0))
+    if error > 0.01:
+        warnings.warn(f"`{dtype}` closing balances are out by up to ${error:,.4f}, use `np.float64` for cent accuracy", RuntimeWarning, stacklevel=_find_stack_level())
+    return cast
+
+def _validate_interest_only_args(interest_only_rate_per_period:float, number_of_interest_only_periods:int|float) -> None:
+    """Check the interest only rate and periods are either both set or both unset.
+
+    Args:
+        interest_only_rate_per_period (float): The interest only rate per period
+        number_of_interest_only_periods (int | float): The number of interest only periods
+
+    Raises:
+        ValueError: If only one of the interest only args is set
+    """
+    if (interest_only_rate_per_period > 0.00) != (number_of_interest_only_periods > 0):
+        raise ValueError("To calculate interest only, you need to pass valid args to `interest_only_rate_per_period` and `number_of_interest_only_periods`")
+
 def calculate_total_period_payment(loan_amount:int|float,
                                    nominal_interest_rate_per_period:float,
                                    number_of_periods:int|float) -> float:
@@ -16,9 +94,30 @@ def calculate_total_period_payment(loan_amount:int|float,
     Returns:
         float: Total Payment Per Peirod (Principal + Interest) `PMT`
     """
-    return loan_amount * (
-        (nominal_interest_rate_per_period * (1+nominal_interest_rate_per_period)**number_of_periods)   / 
-        ((1+nominal_interest_rate_per_period)**number_of_periods - 1)     )
+    # Array likes, EG `pd.Series` rates, broadcast through the batch helper
+    if np.ndim(nominal_interest_rate_per_period) > 0 or np.ndim(number_of_periods) > 0:
+        return _calculate_total_period_payments(loan_amount, nominal_interest_rate_per_period, number_of_periods)
+    # `(1+r)^n - 1` as `expm1(n*log1p(r))`, `1 + r` rounds away the precision of small period rates. 
+    # `math` keeps scalar calls off numpy's per call overhead
+    growth_m1 = math.expm1(number_of_periods * math.log1p(nominal_interest_rate_per_period))
+    return loan_amount * nominal_interest_rate_per_period * (growth_m1 + 1.0) / growth_m1
+
+def _calculate_total_period_payments(loan_amounts:int|float|np.ndarray,
+                                     nominal_interest_rates_per_period:float|np.ndarray,
+                                     numbers_of_periods:int|float|np.ndarray) -> np.ndarray:
+    """Calculate the `PMT` for many loans at once, the numpy form of `calculate_total_period_payment` for the batch functions. 
+    Inputs are broadcast against each other.
+
+    Args:
+        loan_amounts (int | float | np.ndarray): Total Loan Amounts EG `525000.00` | `525000` 
+        nominal_interest_rates_per_period (float | np.ndarray): The interest rates per peirod. EG if `4% Annual`, and payments monthly: `0.04/12 = 0.003333`
+        numbers_of_periods (int | float | np.ndarray): Number of period payments in each Loan: Eg if 30 years paid monthly: `30*12 = 360`
+
+    Returns:
+        np.ndarray: Total Payment Per Peirod (Principal + Interest) `PMT` for each broadcast loan
+    """
+    growth_m1 = np.expm1(numbers_of_periods * np.log1p(nominal_interest_rates_per_period))
+    return loan_amounts * nominal_interest_rates_per_period * (growth_m1 + 1.0) / growth_m1
 
 def calculate_interest_payment(outstanding_loan_amount:int|float,
                               nominal_interest_rate_per_period:float) -> float:
@@ -47,7 +146,7 @@ def calculate_principal_payment(total_period_payment:int|float,
     Returns:
         float: principal payment for the period - `PPMT`
     """
-    return total_period_payment - calculate_interest_payment(outstanding_loan_amount, nominal_interest_rate_per_period)
+    return total_period_payment - outstanding_loan_amount * nominal_interest_rate_per_period
 
 def calculate_principal_and_interest_payment(total_period_payment:int|float,
                                              outstanding_loan_amount:int|float,
@@ -63,10 +162,51 @@ def calculate_principal_and_interest_payment(total_period_payment:int|float,
     Returns:
         tuple[float, float]: (`principal_payment`, `interest_payment`)
     """
-    return (
-        calculate_principal_payment(total_period_payment, outstanding_loan_amount, nominal_interest_rate_per_period), 
-        calculate_interest_payment(outstanding_loan_amount, nominal_interest_rate_per_period)
-    )
+    # Interest once, the principal is the remainder of the payment
+    interest_payment = outstanding_loan_amount * nominal_interest_rate_per_period
+    return total_period_payment - interest_payment, interest_payment
+
+def calculate_total_interest_batch(nominal_annual_interest_rates:float|np.ndarray,
+                                   principal_amounts:int|float|np.ndarray,
+                                   years:int|float|np.ndarray,
+                                   repayment_frequency_periods:int|float,
+                                   interest_only_nominal_annual_interest_rates:float|np.ndarray|None=None,
+                                   interest_only_years:int|float|np.ndarray|None=None) -> np.ndarray:
+    """Calculate the total interest payable for many loans at once. Inputs are broadcast against each other, 
+    EG a column vector of rates and a row vector of years evaluates the whole `(rate, years)` grid in one call.
+
+    Args:
+        nominal_annual_interest_rates (float | np.ndarray): Nominal annual interest rates EG: `3.94%` = `0.0394`
+        principal_amounts (int | float | np.ndarray): The principal amounts `515000` or `515000.00`
+        years (int | float | np.ndarray): The amortization years eg `30` or `30.0`
+        repayment_frequency_periods (int | float): Number of repayment periods per year, `12`, `26` or `52`
+        interest_only_nominal_annual_interest_rates (float | np.ndarray | None, optional): The quoted annual interest only interest rates eg `4.14` = `0.0414`. Defaults to None.
+        interest_only_years (int | float | np.ndarray | None, optional): The years at interest only. EG `1` or `1.0`. Defaults to None.
+
+    Raises:
+        ValueError: If any loan sets only one of its interest only rate and years
+
+    Returns:
+        np.ndarray: Total interest `PMT*n - P` over the amortizing periods plus the interest only payments, for each broadcast loan. 
+         Matches `total_interest` of an `Amortization` with the same terms
+    """
+    principal_amounts = np.asarray(principal_amounts, dtype=np.float64)
+    rates_per_period = np.asarray(nominal_annual_interest_rates, dtype=np.float64) / repayment_frequency_periods
+    if interest_only_nominal_annual_interest_rates is None:
+        interest_only_nominal_annual_interest_rates = 0.0
+    if interest_only_years is None:
+        interest_only_years = 0.0
+    interest_only_rates_per_period = np.asarray(interest_only_nominal_annual_interest_rates, dtype=np.float64) / repayment_frequency_periods
+    interest_only_years = np.asarray(interest_only_years, dtype=np.float64)
+    if np.any((interest_only_rates_per_period > 0.00) != (interest_only_years > 0)):
+        raise ValueError("To calculate interest only, you need to pass valid args to `interest_only_nominal_annual_interest_rates` and `interest_only_years`")
+
+    # Whole periods, truncated the same as the `int` periods of an `Amortization` schedule. A term under one period has no interest only periods
+    number_of_interest_only_periods = np.trunc(interest_only_years * repayment_frequency_periods)
+    number_of_amortizing_periods = np.trunc(np.asarray(years, dtype=np.float64) * repayment_frequency_periods) - number_of_interest_only_periods
+    pmt = _calculate_total_period_payments(principal_amounts, rates_per_period, number_of_amortizing_periods)
+    return (pmt * number_of_amortizing_periods - principal_amounts 
+            + number_of_interest_only_periods * principal_amounts * interest_only_rates_per_period)
 
 def generate_amortization_table(nominal_interest_rate_per_period:float,
                                 principal_amount:int|float,
@@ -74,7 +214,8 @@ def generate_amortization_table(nominal_interest_rate_per_period:float,
                                 total_payment_per_period: int|float|None=None,
                                 additional_payment_per_period: int|float|None=None,
                                 interest_only_rate_per_period:float=0.00,
-                                number_of_interest_only_periods:int|float=0 ) -> pd.DataFrame:
+                                number_of_interest_only_periods:int|float=0,
+                                dtype:type|np.dtype=np.float64 ) -> pd.DataFrame:
     """Generate a Amortization Repaymet table as a `pandas.DataFrame`
 
     Args:
@@ -86,13 +227,23 @@ def generate_amortization_table(nominal_interest_rate_per_period:float,
         additional_payment_per_period (int | float | None, optional): Optional additional payment per period you intend to make, will be added to `total_payment_per_period`. Defaults to None.
         interest_only_rate_per_period (int | float, optional): The quote annual interest rate for the intertest periods, `4.14%` divided by the repayment frequency. Monthly would be passed as `0.0414/12`
         number_of_interest_only_periods (int | float, optional): The interest only periods of the loan. EG: `1 year` paid `monthly` = `1*12` 
+        dtype (type | np.dtype, optional): Float dtype of the money columns. Defaults to `np.float64`. `np.float32` halves the memory of the table, 
+         the schedule is still calculated in float64 and a `RuntimeWarning` is raised if the cast moves a closing balance by more than a cent.
+
+    Raises:
+        ValueError: If only one of `interest_only_rate_per_period` and `number_of_interest_only_periods` is set
 
     Returns:
          pd.DataFrame: Amortization Repayment Schedule Table
     """
-    # Evaluate the Params
-    if (interest_only_rate_per_period > 0.00 and number_of_interest_only_periods <= 0) or (interest_only_rate_per_period <= 0.00 and number_of_interest_only_periods > 0): 
-        raise ArgumentError(None, "To calculate interest only, you need to pass valid args to `interest_only_rate_per_period` and `number_of_interest_only_periods`")
+    _validate_interest_only_args(interest_only_rate_per_period, number_of_interest_only_periods)
+
+    # Coerce the int|float unions once so the arithmetic below, and the numba kernel, only sees float and int
+    nominal_interest_rate_per_period = float(nominal_interest_rate_per_period)
+    principal_amount = float(principal_amount)
+    number_of_periods = int(number_of_periods)
+    interest_only_rate_per_period = float(interest_only_rate_per_period)
+    number_of_interest_only_periods = int(number_of_interest_only_periods)
     
     n_principal_payment_periods = number_of_periods - number_of_interest_only_periods
     expected_total_period_payment = calculate_total_period_payment(principal_amount, nominal_interest_rate_per_period, n_principal_payment_periods)
@@ -102,47 +253,241 @@ def generate_amortization_table(nominal_interest_rate_per_period:float,
 
     if additional_payment_per_period is not None:
         total_payment_per_period = total_payment_per_period + additional_payment_per_period
+    total_payment_per_period = float(total_payment_per_period)
+
+    # Minimum repayments can't pay the loan off early, the whole schedule has a closed form
+    if total_payment_per_period == expected_total_period_payment:
+        columns, _, _ = _build_schedule_vectorized(
+            nominal_interest_rate_per_period,
+            principal_amount,
+            number_of_periods,
+            interest_only_rate_per_period,
+            number_of_interest_only_periods
+        )
+        return pd.DataFrame(_cast_schedule_columns(columns, dtype), copy=False)
+
+    # Compiled kernel when numba is installed
+    if _amortize_kernel is not None:
+        opening_balance, interest, principal, period_payment, closing_balance = (np.empty(number_of_periods, dtype=np.float64) for _ in range(5))
+        rows = _amortize_kernel(
+            nominal_interest_rate_per_period, principal_amount, number_of_periods,
+            total_payment_per_period, interest_only_rate_per_period, number_of_interest_only_periods,
+            opening_balance, interest, principal, period_payment, closing_balance
+        )
+        interest = interest[:rows]
+        return pd.DataFrame(_cast_schedule_columns({
+            'period': np.arange(1, rows + 1),
+            'opening_balance': opening_balance[:rows],
+            'interest': interest,
+            'principal': principal[:rows],
+            'period_payment': period_payment[:rows],
+            'closing_balance': closing_balance[:rows],
+            'cumulative_interest': _reverse_cumulative_sum(interest)
+        }, dtype), copy=False)
     
-    # Init data dict
-    data = {
-        'period': [],
-        'opening_balance' : [],
-        'interest': [],
-        'principal': [], 
-        'period_payment': [],
-        'closing_balance': []
-    }
+    # Preallocate the columns for every period, the loan may be repaid early so track the periods written
+    n = number_of_periods
+    period = np.arange(1, n + 1)
+    opening_balance = np.empty(n, dtype=np.float64)
+    interest = np.empty(n, dtype=np.float64)
+    principal = np.empty(n, dtype=np.float64)
+    period_payment = np.empty(n, dtype=np.float64)
+    closing_balance = np.empty(n, dtype=np.float64)
+
+    # Bind the loop invariants to locals, validation guarantees the interest only rate and periods are set together
+    r = nominal_interest_rate_per_period
+    pmt = total_payment_per_period
+    io_r = interest_only_rate_per_period
+    io_n = number_of_interest_only_periods
 
     # Iterate through periods until the peirods are complete or the loan is $0.00
     opening_loan_balance = principal_amount
-    for period in range(1, number_of_periods+1):
+    for i in range(n):
         
-        if (interest_only_rate_per_period > 0.00 and number_of_interest_only_periods > 0) and period <= number_of_interest_only_periods:
-            interest = opening_loan_balance * interest_only_rate_per_period
-            principal = 0 
-            period_payment = interest
+        if i < io_n:
+            period_interest = opening_loan_balance * io_r
+            period_principal = 0 
+            payment = period_interest
 
         else:
-            principal, interest = calculate_principal_and_interest_payment(total_payment_per_period, opening_loan_balance, nominal_interest_rate_per_period)
-            period_payment = total_payment_per_period
+            period_principal, period_interest = calculate_principal_and_interest_payment(pmt, opening_loan_balance, r)
+            payment = pmt
 
-        closing_loan_balance = opening_loan_balance - principal
-        if closing_loan_balance < 0:
-            principal += closing_loan_balance
-            closing_loan_balance = 0
-            period_payment = principal + interest
+        closing_loan_balance = opening_loan_balance - period_principal
+        if closing_loan_balance <= 0:
+            break
 
-        data['period'].append(period)
-        data['opening_balance'].append(opening_loan_balance)
-        data['interest'].append(interest)
-        data['principal'].append(principal)
-        data['period_payment'].append(period_payment)
-        data['closing_balance'].append(round(closing_loan_balance, 6))
+        opening_balance[i] = opening_loan_balance
+        interest[i] = period_interest
+        principal[i] = period_principal
+        period_payment[i] = payment
+        closing_balance[i] = round(closing_loan_balance, 6)
 
         opening_loan_balance = closing_loan_balance
-        if opening_loan_balance <= 0: 
-            break 
-    df = pd.DataFrame(data=data)
-    # Sum interest from bottom up then reverse and add as column 
-    df['cumulative_interest']  = df['interest'][::-1].cumsum()[::-1]
-    return df
+    else:
+        i = n
+    written = i
+
+    # The loop broke on the final period, settle any overshoot of $0.00 once here rather than checking every period
+    if written < n:
+        if closing_loan_balance < 0:
+            period_principal += closing_loan_balance
+            payment = period_principal + period_interest
+        opening_balance[i] = opening_loan_balance
+        interest[i] = period_interest
+        principal[i] = period_principal
+        period_payment[i] = payment
+        closing_balance[i] = 0.0
+        written += 1
+
+    return pd.DataFrame(_cast_schedule_columns({
+        'period': period[:written],
+        'opening_balance': opening_balance[:written],
+        'interest': interest[:written],
+        'principal': principal[:written],
+        'period_payment': period_payment[:written],
+        'closing_balance': closing_balance[:written],
+        'cumulative_interest': _reverse_cumulative_sum(interest[:written])
+    }, dtype), copy=False)
+
+def generate_amortization_tables(nominal_interest_rates_per_period:float|list[float]|np.ndarray,
+                                 principal_amounts:int|float|list[int|float]|np.ndarray,
+                                 number_of_periods:int|list[int]|np.ndarray,
+                                 total_payments_per_period:int|float|list[int|float]|np.ndarray|None=None ) -> dict[str, np.ndarray]:
+    """Generate the amortization tables of many loans at once by broadcasting the closed form balance 
+    `B(k) = P*(1+r)^k - PMT*((1+r)^k - 1)/r` over a `(loans, periods)` grid, as wide as the longest loan.
+
+    Args:
+        nominal_interest_rates_per_period (float | list[float] | np.ndarray): The quote annual interest rates divided by the repayment frequency. EG `[0.0385/12, 0.0400/12]`
+        principal_amounts (int | float | list[int | float] | np.ndarray): The principal amounts borrowed, broadcast against the rates. EG `545000.00`
+        number_of_periods (int | list[int] | np.ndarray): Number of periods over the life of the loans, broadcast against the rates. 
+         EG: `30 years` paid `monthly` = `30*12`, or `[20*12, 30*12]` for a term per loan
+        total_payments_per_period (int | float | list[int | float] | np.ndarray | None, optional): Optional total payment per period `PMT` for each loan. Defaults to None.
+         Payments below a loan's minimum `PMT` are raised to the minimum. Loans repaid early, or with shorter terms, have zero rows after the final payment.
+
+    Returns:
+        dict[str, np.ndarray]: The `generate_amortization_table` columns, each a `(loans, periods)` array
+    """
+    # A payment per loan is broadcast with the terms, no payments is a zero payment raised to each minimum `PMT`
+    r, principal_amount, n, total_payments = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(nominal_interest_rates_per_period, dtype=np.float64)),
+        np.atleast_1d(np.asarray(principal_amounts, dtype=np.float64)),
+        np.atleast_1d(np.asarray(number_of_periods, dtype=np.int64)),
+        np.atleast_1d(np.asarray(0.0 if total_payments_per_period is None else total_payments_per_period, dtype=np.float64))
+    )
+    pmt = np.maximum(total_payments, _calculate_total_period_payments(principal_amount, r, n))
+    r, principal_amount, pmt, n = r[:, None], principal_amount[:, None], pmt[:, None], n[:, None]
+
+    k = np.arange(n.max())
+    growth_m1 = _growth_factors_minus_one(r, len(k))
+    # `P*(1+r)^k - PMT*((1+r)^k - 1)/r` regrouped around `(1+r)^k - 1`, dividing once per loan rather than once per period
+    pmt_over_r = pmt * (1.0 / r)
+    opening_balance = principal_amount + (principal_amount - pmt_over_r)*growth_m1
+
+    # Periods after the loan is repaid have a non-positive closed form balance, zero them and any periods past the loan's term out
+    active = (opening_balance > 0) & (k < n)
+    opening_balance = np.where(active, opening_balance, 0.0)
+    interest = opening_balance * r
+    principal = np.where(active, pmt - interest, 0.0)
+    closing_balance = opening_balance - principal
+
+    # The final payment only covers what is left
+    overpaid = closing_balance < 0
+    principal = np.where(overpaid, opening_balance, principal)
+    closing_balance = np.where(overpaid, 0.0, closing_balance)
+    period_payment = np.where(overpaid | ~active, principal + interest, pmt)
+
+    return {
+        'period': np.broadcast_to(k + 1, opening_balance.shape),
+        'opening_balance': opening_balance,
+        'interest': interest,
+        'principal': principal,
+        'period_payment': period_payment,
+        'closing_balance': np.round(closing_balance, 6),
+        'cumulative_interest': _reverse_cumulative_sum(interest)
+    }
+
+def _build_schedule_vectorized(nominal_interest_rate_per_period:float,
+                               principal_amount:int|float,
+                               number_of_periods:int|float,
+                               interest_only_rate_per_period:float=0.00,
+                               number_of_interest_only_periods:int|float=0) -> tuple[dict[str, np.ndarray], float, float]:
+    """Build the minimum repayment amortization table with the closed form annuity balance 
+    `B(k) = P*(((1+r)^M - 1) - ((1+r)^k - 1))/((1+r)^M - 1)` over `M` amortizing periods, instead of iterating period by period.
+
+    Args:
+        nominal_interest_rate_per_period (float): The quote annual interest rate `3.85%` divided by the repayment frequency. Monthly would be passed as `0.0385/12`
+        principal_amount (int | float): The principal amount borrowed `545000.00`
+        number_of_periods (int | float): Number of periods over the life of the loan. EG: `30 years` paid `monthly` = `30*12` 
+        interest_only_rate_per_period (float, optional): The quote annual interest rate for the intertest periods, `4.14%` divided by the repayment frequency. Monthly would be passed as `0.0414/12`
+        number_of_interest_only_periods (int | float, optional): The interest only periods of the loan. EG: `1 year` paid `monthly` = `1*12` 
+
+    Returns:
+        tuple[dict[str, np.ndarray], float, float]: (`columns`, `total_interest`, `PMT`). Amortization Repayment Schedule columns, matching the 
+         `generate_amortization_table` columns without additional payments, with the total interest and payment per period computed in the same pass
+    """
+    _validate_interest_only_args(interest_only_rate_per_period, number_of_interest_only_periods)
+
+    r = nominal_interest_rate_per_period
+    n = int(number_of_periods)
+    n_io = int(number_of_interest_only_periods)
+    pmt = calculate_total_period_payment(principal_amount, r, n - n_io)
+
+    # Opening balance of amortizing period k is the closed form balance after k-1 payments
+    # Growth less one from `expm1`, the same as the `PMT`, so small period rates keep their precision
+    factor_m1 = _growth_factors_minus_one(r, n - n_io)
+    growth_m1 = math.expm1((n - n_io) * math.log1p(r))
+
+    # One pass over the columns rather than one per intermediate array
+    if _closed_form_schedule_kernel is not None:
+        opening_balance, interest, principal, period_payment, closing_balance, cumulative_interest = (np.empty(n, dtype=np.float64) for _ in range(6))
+        _closed_form_schedule_kernel(
+            float(r), float(principal_amount), float(pmt), growth_m1, float(interest_only_rate_per_period), factor_m1,
+            opening_balance, interest, principal, period_payment, closing_balance, cumulative_interest
+        )
+        columns = {
+            'period': np.arange(1, n + 1),
+            'opening_balance': opening_balance,
+            'interest': interest,
+            'principal': principal,
+            'period_payment': period_payment,
+            'closing_balance': closing_balance,
+            'cumulative_interest': cumulative_interest
+        }
+        return columns, float(cumulative_interest[0]), pmt
+
+    # `P*(1+r)^k - PMT*((1+r)^k - 1)/r` with `PMT/r = P*(1+r)^M/((1+r)^M - 1)` substituted, 
+    # one subtract and multiply per period without the cancellation between two large terms
+    opening_balance = (principal_amount / growth_m1) * (growth_m1 - factor_m1)
+    interest = opening_balance * r
+    principal = pmt - interest
+    period_payment = np.full(n - n_io, pmt)
+    closing_balance = opening_balance - principal
+
+    # Final period can overshoot $0.00 by floating point residue, settle it the same way the iterative table does
+    overpaid = closing_balance < 0
+    principal = np.where(overpaid, principal + closing_balance, principal)
+    period_payment = np.where(overpaid, principal + interest, period_payment)
+    closing_balance = np.where(overpaid, 0.0, closing_balance)
+
+    # Interest only periods pay interest on the full principal
+    if n_io > 0:
+        io_interest = principal_amount * interest_only_rate_per_period
+        opening_balance = np.concatenate((np.full(n_io, principal_amount, dtype=np.float64), opening_balance))
+        interest = np.concatenate((np.full(n_io, io_interest), interest))
+        principal = np.concatenate((np.zeros(n_io), principal))
+        period_payment = np.concatenate((np.full(n_io, io_interest), period_payment))
+        closing_balance = np.concatenate((np.full(n_io, principal_amount, dtype=np.float64), closing_balance))
+
+    # The first reverse cumulative value is the total interest, no second pass over the array needed
+    cumulative_interest = _reverse_cumulative_sum(interest)
+    columns = {
+        'period': np.arange(1, n + 1),
+        'opening_balance': opening_balance,
+        'interest': interest,
+        'principal': principal,
+        'period_payment': period_payment,
+        'closing_balance': np.round(closing_balance, 6),
+        'cumulative_interest': cumulative_interest
+    }
+    return columns, float(cumulative_interest[0]), pmt
@@ -0,0 +1,121 @@
+"""Numba compiled amortization kernels.
+Requires the optional `numba` dependency, import guarded by `_amortization_functions`.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, types
+
+# Explicit signature compiles (or loads from cache) at import rather than on the first call
+_KERNEL_SIGNATURE = types.int64(
+    types.float64, types.float64, types.int64, types.float64, types.float64, types.int64,
+    types.float64[:], types.float64[:], types.float64[:], types.float64[:], types.float64[:]
+)
+
+@njit(_KERNEL_SIGNATURE, cache=True, fastmath=True)
+def _amortize_kernel(r, P, n, pmt, io_r, n_io, opening_balance, interest, principal, period_payment, closing_balance):
+    """Iterate the amortization schedule period by period, writing each column into preallocated arrays.
+    Keep pandas out of here, the DataFrame is built by the Python caller.
+
+    Args:
+        r (float): Nominal interest rate per period
+        P (float): Principal amount
+        n (int): Number of periods
+        pmt (float): Total payment per period `PMT`, including any additional payment
+        io_r (float): Interest only rate per period
+        n_io (int): Number of interest only periods
+        opening_balance, interest, principal, period_payment, closing_balance (np.ndarray): Output arrays of length `n`
+
+    Returns:
+        int: Number of periods written, less than `n` when the loan is repaid early
+    """
+    opening_loan_balance = P
+    rows = 0
+    for i in range(n):
+        # The caller validates the interest only rate and periods are set together
+        if i < n_io:
+            period_interest = opening_loan_balance * io_r
+            period_principal = 0.0
+            payment = period_interest
+        else:
+            period_interest = opening_loan_balance * r
+            period_principal = pmt - period_interest
+            payment = pmt
+
+        closing_loan_balance = opening_loan_balance - period_principal
+        if closing_loan_balance < 0:
+            period_principal += closing_loan_balance
+            closing_loan_balance = 0.0
+            payment = period_principal + period_interest
+
+        opening_balance[i] = opening_loan_balance
+        interest[i] = period_interest
+        principal[i] = period_principal
+        period_payment[i] = payment
+        closing_balance[i] = round(closing_loan_balance, 6)
+        rows = i + 1
+
+        opening_loan_balance = closing_loan_balance
+        if opening_loan_balance <= 0:
+            break
+    return rows
+
+_SCHEDULE_SIGNATURE = types.void(
+    types.float64, types.float64, types.float64, types.float64, types.float64, types.float64[:],
+    types.float64[:], types.float64[:], types.float64[:], types.float64[:], types.float64[:], types.float64[:]
+)
+
+# No fastmath, the results match the numpy closed form to the bit
+@njit(_SCHEDULE_SIGNATURE, cache=True)
+def _closed_form_schedule_kernel(r, P, pmt, growth_m1, io_r, factor_m1, opening_balance, interest, principal, period_payment, closing_balance, cumulative_interest):
+    """Fill the minimum repayment schedule from the closed form balance in one forward pass, 
+    then the reverse cumulative interest in one backward pass, rather than a numpy pass per intermediate array.
+
+    Args:
+        r (float): Nominal interest rate per period
+        P (float): Principal amount
+        pmt (float): Minimum total payment per period `PMT`
+        growth_m1 (float): `(1+r)^M - 1` over the `M` amortizing periods
+        io_r (float): Interest only rate per period
+        factor_m1 (np.ndarray): `(1+r)^k - 1` for each amortizing period `k = 0..M-1`
+        opening_balance, interest, principal, period_payment, closing_balance, cumulative_interest (np.ndarray): Output arrays 
+         of length interest only periods + `M`
+    """
+    n = opening_balance.shape[0]
+    n_io = n - factor_m1.shape[0]
+
+    # Interest only periods pay interest on the full principal
+    io_interest = P * io_r
+    io_closing = np.rint(P * 1e6) / 1e6
+    for i in range(n_io):
+        opening_balance[i] = P
+        interest[i] = io_interest
+        principal[i] = 0.0
+        period_payment[i] = io_interest
+        closing_balance[i] = io_closing
+
+    scale = P / growth_m1
+    for k in range(n - n_io):
+        opening_loan_balance = scale * (growth_m1 - factor_m1[k])
+        period_interest = opening_loan_balance * r
+        period_principal = pmt - period_interest
+        payment = pmt
+        closing_loan_balance = opening_loan_balance - period_principal
+        # Floating point residue can overshoot $0.00 in the final period
+        if closing_loan_balance < 0:
+            period_principal = period_principal + closing_loan_balance
+            payment = period_principal + period_interest
+            closing_loan_balance = 0.0
+
+        i = n_io + k
+        opening_balance[i] = opening_loan_balance
+        interest[i] = period_interest
+        principal[i] = period_principal
+        period_payment[i] = payment
+        # `np.round(x, 6)`
+        closing_balance[i] = np.rint(closing_loan_balance * 1e6) / 1e6
+
+    total = 0.0
+    for i in range(n - 1, -1, -1):
+        total += interest[i]
+        cumulative_interest[i] = total
@@ -0,0 +1,116 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython compiled amortization kernels.
+Built by `setup.py` when Cython is available, for installs without `numba`. Import guarded by `_amortization_functions`.
+"""
+from libc.math cimport rint
+
+
+def amortize_kernel(double r, double P, Py_ssize_t n, double pmt, double io_r, Py_ssize_t n_io,
+                    double[::1] opening_balance, double[::1] interest, double[::1] principal,
+                    double[::1] period_payment, double[::1] closing_balance):
+    """Iterate the amortization schedule period by period, writing each column into preallocated arrays.
+    Same contract as the numba `_amortize_kernel`.
+
+    Args:
+        r (float): Nominal interest rate per period
+        P (float): Principal amount
+        n (int): Number of periods
+        pmt (float): Total payment per period `PMT`, including any additional payment
+        io_r (float): Interest only rate per period
+        n_io (int): Number of interest only periods
+        opening_balance, interest, principal, period_payment, closing_balance (np.ndarray): Contiguous float64 output arrays of length `n`
+
+    Returns:
+        int: Number of periods written, less than `n` when the loan is repaid early
+    """
+    cdef double opening_loan_balance = P
+    cdef double closing_loan_balance, period_interest, period_principal, payment
+    cdef Py_ssize_t i, rows = 0
+    with nogil:
+        for i in range(n):
+            # The caller validates the interest only rate and periods are set together
+            if i < n_io:
+                period_interest = opening_loan_balance * io_r
+                period_principal = 0.0
+                payment = period_interest
+            else:
+                period_interest = opening_loan_balance * r
+                period_principal = pmt - period_interest
+                payment = pmt
+
+            closing_loan_balance = opening_loan_balance - period_principal
+            if closing_loan_balance < 0:
+                period_principal += closing_loan_balance
+                closing_loan_balance = 0.0
+                payment = period_principal + period_interest
+
+            opening_balance[i] = opening_loan_balance
+            interest[i] = period_interest
+            principal[i] = period_principal
+            period_payment[i] = payment
+            # `round(x, 6)`, `rint` rounds half to even like the builtin
+            closing_balance[i] = rint(closing_loan_balance * 1e6) / 1e6
+            rows = i + 1
+
+            opening_loan_balance = closing_loan_balance
+            if opening_loan_balance <= 0:
+                break
+    return rows
+
+
+def closed_form_schedule_kernel(double r, double P, double pmt, double growth_m1, double io_r, const double[::1] factor_m1,
+                                double[::1] opening_balance, double[::1] interest, double[::1] principal,
+                                double[::1] period_payment, double[::1] closing_balance, double[::1] cumulative_interest):
+    """Fill the minimum repayment schedule from the closed form balance in one forward pass, 
+    then the reverse cumulative interest in one backward pass. Same contract as the numba `_closed_form_schedule_kernel`.
+
+    Args:
+        r (float): Nominal interest rate per period
+        P (float): Principal amount
+        pmt (float): Minimum total payment per period `PMT`
+        growth_m1 (float): `(1+r)^M - 1` over the `M` amortizing periods
+        io_r (float): Interest only rate per period
+        factor_m1 (np.ndarray): `(1+r)^k - 1` for each amortizing period `k = 0..M-1`
+        opening_balance, interest, principal, period_payment, closing_balance, cumulative_interest (np.ndarray): Contiguous float64 output arrays 
+         of length interest only periods + `M`
+    """
+    cdef Py_ssize_t n = opening_balance.shape[0]
+    cdef Py_ssize_t n_io = n - factor_m1.shape[0]
+    cdef double io_interest = P * io_r
+    cdef double io_closing = rint(P * 1e6) / 1e6
+    cdef double scale = P / growth_m1
+    cdef double opening_loan_balance, closing_loan_balance, period_interest, period_principal, payment
+    cdef double total = 0.0
+    cdef Py_ssize_t i, k
+    with nogil:
+        # Interest only periods pay interest on the full principal
+        for i in range(n_io):
+            opening_balance[i] = P
+            interest[i] = io_interest
+            principal[i] = 0.0
+            period_payment[i] = io_interest
+            closing_balance[i] = io_closing
+
+        for k in range(n - n_io):
+            opening_loan_balance = scale * (growth_m1 - factor_m1[k])
+            period_interest = opening_loan_balance * r
+            period_principal = pmt - period_interest
+            payment = pmt
+            closing_loan_balance = opening_loan_balance - period_principal
+            # Floating point residue can overshoot $0.00 in the final period
+            if closing_loan_balance < 0:
+                period_principal = period_principal + closing_loan_balance
+                payment = period_principal + period_interest
+                closing_loan_balance = 0.0
+
+            i = n_io + k
+            opening_balance[i] = opening_loan_balance
+            interest[i] = period_interest
+            principal[i] = period_principal
+            period_payment[i] = payment
+            # `np.round(x, 6)`
+            closing_balance[i] = rint(closing_loan_balance * 1e6) / 1e6
+
+        for i in range(n - 1, -1, -1):
+            total += interest[i]
+            cumulative_interest[i] = total
@@ -1,20 +1,23 @@
 """Graph Plotting Functions 
 """
 from __future__ import annotations
-import sys
+# Optional dependency, resolved once at import
+_PLOTLY_AVAILABLE = False
 try:
     import plotly.express as px
     import plotly.graph_objs as go
+    _PLOTLY_AVAILABLE = True
 except ImportError:
     pass
 
+import numpy as np
 import pandas as pd
 
-def plot_stacked_bar_chart(df:pd.DataFrame, x:str, y:list[str], chart_layout:dict)-> go.Figure:
+def plot_stacked_bar_chart(df:pd.DataFrame|dict[str, np.ndarray], x:str, y:list[str], chart_layout:dict)-> go.Figure:
     """Plot Dataframe data in a stacked bar chart
 
     Args:
-        df (pd.DataFrame): Pandas Dataframe containing data to be stacked
+        df (pd.DataFrame | dict[str, np.ndarray]): Pandas Dataframe, or dict of column name to array, containing data to be stacked
         x (str): X_Axis Column Name
         y (list[str]): Y_Axis Column Names
         chart_layout (dict): Dictionary of chart properties to be updated: [Plotty API Docs](https://plotly.com/python-api-reference/)
@@ -25,9 +28,11 @@ def plot_stacked_bar_chart(df:pd.DataFrame, x:str, y:list[str], chart_layout:dic
     Returns:
         go.Figure: Plotted Data Figure
     """
-    if 'plotly.express' not in sys.modules:
+    if not _PLOTLY_AVAILABLE:
         raise ImportError('plotly.express is required for charts. Please pip intall plotly-express')
 
     fig = px.bar(df, x=x, y=y, barmode='stack')
-    fig.update_layout(chart_layout)
+    # Skip plotly's layout validation pass when there is nothing to update
+    if chart_layout:
+        fig.update_layout(chart_layout)
     return fig
@@ -1,7 +1,23 @@
 from setuptools import setup
 
+ext_modules = []
+
+# Optionally compile the Cython amortization kernel, for installs that can't ship numba. 
+# Cython is a build requirement in pyproject.toml so isolated builds see it, a failed compile, 
+# EG no C compiler, falls back to the numba or pure Python kernels rather than failing the install
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+if cythonize is not None:
+    for extension in cythonize('AmortaPy/core/_loan_kernel.pyx'):
+        extension.optional = True
+        ext_modules.append(extension)
+
 setup(
     setup_requires=['pytest-runner'],
     tests_require=['pytest==4.4.1'],
     test_suite='tests',
-)
\ No newline at end of file
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,76 @@
+"""Amortization loan terms, their validation and the schedule dtype
+"""
+from __future__ import annotations
+import warnings
+
+import numpy as np
+import pytest
+
+from AmortaPy import Amortization, generate_amortization_schedule, generate_amortization_table
+
+
+def test_interest_only_term_under_one_period_has_no_interest_only_periods():
+    loan = Amortization(0.04, 100000, 10, None, 0.05, 0.05)
+    assert loan.n_interest_only_periods == 0
+    assert not loan.has_interest_only
+    assert loan.total_interest_only_payments == 0.0
+    assert loan.total_interest == pytest.approx(Amortization(0.04, 100000, 10).total_interest, rel=1e-12)
+    assert Amortization.calculate_total_interest(0.04, 100000, 10, None, 0.05, 0.05) == pytest.approx(loan.total_interest, rel=1e-12)
+
+
+def test_interest_only_periods_truncate_to_whole_periods():
+    loan = Amortization(0.04, 100000, 10, None, 0.05, 1.05)
+    assert loan.n_interest_only_periods == 12
+    assert loan.total_interest_only_payments == pytest.approx(12 * 100000 * 0.05 / 12)
+
+
+@pytest.mark.parametrize('interest_only_terms', [(0.05, None), (None, 1)])
+def test_interest_only_requires_rate_and_years(interest_only_terms):
+    with pytest.raises(ValueError, match='interest_only_years'):
+        Amortization(0.04, 100000, 10, None, *interest_only_terms)
+
+
+@pytest.mark.parametrize('inplace', [True, False])
+def test_set_interest_only_validates_before_updating(inplace):
+    loan = Amortization(0.04, 100000, 10, None, 0.05, 1)
+    with pytest.raises(ValueError, match='interest_only_years'):
+        loan.set_interest_only(0.05, 0, inplace=inplace)
+    assert (loan.interest_only_nominal_annual_interest_rate, loan.interest_only_years) == (0.05, 1)
+    assert loan.n_interest_only_periods == 12
+
+
+def test_float32_schedule_stays_within_the_warned_error():
+    with pytest.warns(RuntimeWarning, match='float32'):
+        loan = Amortization(0.0394, 515000, 30, dtype=np.float32)
+    reference = Amortization(0.0394, 515000, 30)
+    assert loan.dtype == np.float32
+    for column, values in loan.amortization_arrays.items():
+        assert values.dtype == (reference.amortization_arrays[column].dtype if column == 'period' else np.float32)
+        np.testing.assert_allclose(values, reference.amortization_arrays[column], rtol=1e-6, atol=0.05)
+    assert loan.total_interest == reference.total_interest
+
+
+def test_float32_schedule_within_a_cent_does_not_warn():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        loan = Amortization(0.0394, 100000, 30, dtype=np.float32)
+    assert loan.amortization_schedule['closing_balance'].dtype == np.float32
+
+
+@pytest.mark.parametrize('build', [
+    lambda loan: Amortization(0.0394, 515000, 30, dtype=np.float32),
+    lambda loan: generate_amortization_schedule(0.0394, 515000, 30, dtype=np.float32),
+    lambda loan: generate_amortization_table(0.0394/12, 515000, 360, dtype=np.float32),
+    lambda loan: generate_amortization_table(0.0394/12, 515000, 360, 3000, dtype=np.float32),
+    lambda loan: loan.copy(),
+    lambda loan: loan.set_years(25),
+    lambda loan: loan.set_years(20, inplace=False),
+    lambda loan: loan.set_interest_only(0.0414, 1, inplace=False),
+], ids=['init', 'api', 'table', 'table_overpayment', 'copy', 'setter', 'setter_copy', 'set_interest_only'])
+def test_float32_warning_points_at_the_caller(build):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        loan = Amortization(0.0394, 515000, 30, dtype=np.float32)
+    with pytest.warns(RuntimeWarning, match='float32') as record:
+        build(loan)
+    assert record[0].filename == __file__
@@ -0,0 +1,77 @@
+"""Module level amortization functions, scalar and batch
+"""
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+import pytest
+
+from AmortaPy import calculate_total_period_payment, generate_amortization_table, generate_amortization_tables
+
+COLUMNS = ['opening_balance', 'interest', 'principal', 'period_payment', 'closing_balance', 'cumulative_interest']
+
+
+def assert_row_matches_table(tables, i, table):
+    """Row `i` of the batch tables equals the single loan table, then zeros after its final period"""
+    rows = len(table)
+    for column in COLUMNS:
+        np.testing.assert_allclose(tables[column][i, :rows], table[column].to_numpy(), rtol=1e-9, atol=1e-6, err_msg=column)
+        assert not tables[column][i, rows:].any(), column
+
+
+@pytest.mark.parametrize('rates', [pd.Series([0.04/12, 0.05/12]), np.array([0.04/12, 0.05/12])])
+def test_calculate_total_period_payment_accepts_array_likes(rates):
+    payments = calculate_total_period_payment(500000, rates, 360)
+    expected = [calculate_total_period_payment(500000, rate, 360) for rate in [0.04/12, 0.05/12]]
+    np.testing.assert_allclose(np.asarray(payments), expected, rtol=1e-12)
+    if isinstance(rates, pd.Series):
+        assert isinstance(payments, pd.Series)
+
+
+def test_calculate_total_period_payment_scalar_is_float():
+    payment = calculate_total_period_payment(500000, 0.04/12, 360)
+    assert type(payment) is float
+    assert payment == pytest.approx(2387.08, abs=0.01)
+
+
+def test_generate_amortization_tables_broadcasts_a_payment_per_loan():
+    payments = [3000, 3500]
+    tables = generate_amortization_tables(0.04/12, 515000, 360, total_payments_per_period=payments)
+    assert tables['opening_balance'].shape == (2, 360)
+    for i, payment in enumerate(payments):
+        assert_row_matches_table(tables, i, generate_amortization_table(0.04/12, 515000, 360, payment))
+
+
+def test_generate_amortization_tables_settles_the_final_payment():
+    tables = generate_amortization_tables([0.04/12, 0.05/12], 515000, 360, 3500)
+    for i in range(2):
+        paid = tables['closing_balance'][i] > 0
+        final = paid.sum()
+        assert final < 360
+        assert tables['closing_balance'][i, final] == 0.0
+        assert tables['period_payment'][i, final] < 3500
+        assert tables['principal'][i].sum() == pytest.approx(515000, rel=1e-12)
+
+
+def test_generate_amortization_tables_raises_payments_below_the_minimum():
+    tables = generate_amortization_tables([0.04/12, 0.05/12], 515000, 360, [0, 100])
+    for i, rate in enumerate([0.04/12, 0.05/12]):
+        assert_row_matches_table(tables, i, generate_amortization_table(rate, 515000, 360))
+
+
+# (rates per period, principals, periods, total payments), mixed per loan terms broadcast against each other
+PER_LOAN_TERMS = {
+    'terms': ([0.0394/12, 0.045/12, 0.05/12], 515000, [20*12, 25*12, 30*12], None),
+    'terms_and_principals': ([0.0394/12, 0.045/12, 0.05/12], [300000, 515000, 800000], [30*12, 15*12, 25*12], None),
+    'terms_and_payments': ([0.0394/12, 0.045/12, 0.05/12], 515000, [20*12, 25*12, 30*12], [2000, 4000, 3300]),
+    'weekly_terms_and_payments': (0.0394/52, [250000, 515000], [10*52, 30*52], [600, 700]),
+}
+
+
+@pytest.mark.parametrize('case', list(PER_LOAN_TERMS))
+def test_generate_amortization_tables_rows_match_generate_amortization_table(case):
+    rates, principals, periods, payments = PER_LOAN_TERMS[case]
+    tables = generate_amortization_tables(rates, principals, periods, payments)
+    loans = np.broadcast_arrays(*(np.atleast_1d(np.asarray(terms, dtype=object)) for terms in (rates, principals, periods, payments)))
+    assert tables['opening_balance'].shape == (len(loans[0]), max(np.atleast_1d(periods)))
+    for i, (rate, principal, n, payment) in enumerate(zip(*loans)):
+        assert_row_matches_table(tables, i, generate_amortization_table(rate, principal, n, payment))
@@ -0,0 +1,133 @@
+"""Parity of the compiled amortization kernels with the pure Python fallbacks and a reference loop
+"""
+from __future__ import annotations
+import numpy as np
+import pytest
+
+import AmortaPy.core._amortization as amortization
+import AmortaPy.core._amortization_functions as functions
+from AmortaPy.core._amortization_functions import calculate_total_period_payment, generate_amortization_table
+
+COLUMNS = ['opening_balance', 'interest', 'principal', 'period_payment', 'closing_balance', 'cumulative_interest']
+
+# (rate per period, principal, periods, total payment, additional payment, interest only rate per period, interest only periods)
+CASES = {
+    'minimum': (0.0394/12, 515000, 30*12, None, None, 0.0, 0),
+    'overpayment': (0.0394/12, 515000, 30*12, 3500, None, 0.0, 0),
+    'early_payoff': (0.0394/12, 515000, 30*12, None, 1000, 0.0, 0),
+    'interest_only': (0.0394/12, 515000, 30*12, None, None, 0.0414/12, 12),
+    'interest_only_overpayment': (0.0394/12, 515000, 30*12, 3500, None, 0.0414/12, 12),
+    'weekly': (0.0394/52, 515000, 30*52, None, None, 0.0, 0),
+    'weekly_overpayment': (0.0394/52, 515000, 30*52, 700, None, 0.0, 0),
+}
+
+
+def _numba_kernels():
+    pytest.importorskip('numba')
+    from AmortaPy.core import _amortization_functions_nb
+    return _amortization_functions_nb._amortize_kernel, _amortization_functions_nb._closed_form_schedule_kernel
+
+
+def _cython_kernels():
+    _loan_kernel = pytest.importorskip('AmortaPy.core._loan_kernel')
+    return _loan_kernel.amortize_kernel, _loan_kernel.closed_form_schedule_kernel
+
+
+KERNELS = {
+    'python': lambda: (None, None),
+    'numba': _numba_kernels,
+    'cython': _cython_kernels,
+}
+
+
+@pytest.fixture(params=list(KERNELS))
+def kernels(request, monkeypatch):
+    """Swap the module kernels for one implementation, `python` being the fallbacks without any kernel"""
+    amortize_kernel, closed_form_schedule_kernel = KERNELS[request.param]()
+    monkeypatch.setattr(functions, '_amortize_kernel', amortize_kernel)
+    monkeypatch.setattr(functions, '_closed_form_schedule_kernel', closed_form_schedule_kernel)
+    # Memoised schedules were built by whichever kernel was loaded
+    amortization._build_cached_schedule.cache_clear()
+    yield request.param
+    amortization._build_cached_schedule.cache_clear()
+
+
+def reference_schedule(rate, principal_amount, n_periods, total_payment=None, additional_payment=None, io_rate=0.0, n_io=0) -> dict[str, np.ndarray]:
+    """Plain period by period amortization, the definition every kernel has to match"""
+    pmt = calculate_total_period_payment(principal_amount, rate, n_periods - n_io)
+    if total_payment is not None and total_payment > pmt:
+        pmt = total_payment
+    if additional_payment is not None:
+        pmt += additional_payment
+
+    rows = []
+    balance = float(principal_amount)
+    for i in range(n_periods):
+        if i < n_io:
+            interest = balance * io_rate
+            principal, payment = 0.0, interest
+        else:
+            interest = balance * rate
+            principal, payment = pmt - interest, pmt
+        closing = balance - principal
+        if closing <= 0:
+            principal += closing
+            rows.append((balance, interest, principal, principal + interest, 0.0))
+            break
+        rows.append((balance, interest, principal, payment, closing))
+        balance = closing
+
+    values = np.array(rows).T
+    schedule = dict(zip(COLUMNS, values))
+    schedule['cumulative_interest'] = np.cumsum(values[1][::-1])[::-1]
+    return schedule
+
+
+def assert_schedule_matches(actual, expected):
+    assert len(actual['closing_balance']) == len(expected['closing_balance'])
+    for column in COLUMNS:
+        np.testing.assert_allclose(np.asarray(actual[column]), expected[column], rtol=1e-9, atol=1e-6, err_msg=column)
+
+
+@pytest.mark.parametrize('case', list(CASES))
+def test_generate_amortization_table_matches_reference(kernels, case):
+    args = CASES[case]
+    table = generate_amortization_table(*args)
+    assert_schedule_matches(table, reference_schedule(*args))
+    np.testing.assert_array_equal(table['period'], np.arange(1, len(table) + 1))
+
+
+@pytest.mark.parametrize('case', list(CASES))
+def test_kernels_match_python_fallback(kernels, case, monkeypatch):
+    args = CASES[case]
+    compiled = generate_amortization_table(*args)
+    monkeypatch.setattr(functions, '_amortize_kernel', None)
+    monkeypatch.setattr(functions, '_closed_form_schedule_kernel', None)
+    fallback = generate_amortization_table(*args)
+    assert_schedule_matches(compiled, {column: fallback[column].to_numpy() for column in COLUMNS})
+
+
+def test_closed_form_kernels_match_numpy_bitwise(kernels, monkeypatch):
+    args = CASES['interest_only'][:3] + CASES['interest_only'][5:]
+    columns, total_interest, pmt = functions._build_schedule_vectorized(*args)
+    monkeypatch.setattr(functions, '_closed_form_schedule_kernel', None)
+    numpy_columns, numpy_total_interest, numpy_pmt = functions._build_schedule_vectorized(*args)
+    for column in COLUMNS:
+        np.testing.assert_array_equal(columns[column], numpy_columns[column], err_msg=column)
+    assert (total_interest, pmt) == (numpy_total_interest, numpy_pmt)
+
+
+def test_early_payoff_shortens_schedule(kernels):
+    table = generate_amortization_table(*CASES['early_payoff'])
+    assert len(table) < 30*12
+    assert table['closing_balance'].iloc[-1] == 0.0
+    assert table['closing_balance'].iloc[-2] > 0.0
+
+
+@pytest.mark.parametrize('repayment_frequency', ['monthly', 'fortnightly', 'weekly'])
+def test_amortization_schedule_matches_reference(kernels, repayment_frequency):
+    loan = amortization.Amortization(0.0394, 515000, 30, repayment_frequency, 0.0414, 1)
+    periods = loan.repayment_frequency_periods
+    expected = reference_schedule(0.0394/periods, 515000, int(30*periods), io_rate=0.0414/periods, n_io=int(periods))
+    assert_schedule_matches(loan.amortization_arrays, expected)
+    assert loan.total_interest == pytest.approx(expected['cumulative_interest'][0], rel=1e-12)
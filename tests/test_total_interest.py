@@ -0,0 +1,47 @@
+"""Closed form total interest against the interest summed over the amortization schedule
+"""
+from __future__ import annotations
+import numpy as np
+import pytest
+
+from AmortaPy import Amortization, calculate_total_interest_batch, generate_amortization_grid
+
+TERMS = [
+    (0.0394, 515000, 30, 'monthly', None, None),
+    (0.0394, 515000, 25.5, 'weekly', None, None),
+    (0.0394, 515000, 30, 'fortnightly', 0.0414, 1),
+    (0.12, 250000, 7.3, 'weekly', 0.05, 2.5),
+]
+
+
+@pytest.mark.parametrize('terms', TERMS)
+def test_calculate_total_interest_matches_schedule(terms):
+    loan = Amortization(*terms)
+    assert Amortization.calculate_total_interest(*terms) == pytest.approx(loan.total_interest, rel=1e-12)
+
+
+def test_calculate_total_interest_batch_broadcasts_interest_only():
+    rates = np.array([[0.0394], [0.05]])
+    io_years = np.array([0, 1, 2])
+    totals = calculate_total_interest_batch(rates, 515000, 30, 12, np.where(io_years > 0, 0.0414, 0.0), io_years)
+    assert totals.shape == (2, 3)
+    for (i, j), total in np.ndenumerate(totals):
+        io_terms = (0.0414, io_years[j]) if io_years[j] else (None, None)
+        assert total == pytest.approx(Amortization(rates[i, 0], 515000, 30, 12, *io_terms).total_interest, rel=1e-12)
+
+
+def test_calculate_total_interest_batch_requires_both_interest_only_args():
+    with pytest.raises(ValueError):
+        calculate_total_interest_batch([0.0394, 0.05], 515000, 30, 12, [0.0414, 0.0], [1, 1])
+    with pytest.raises(ValueError):
+        Amortization.calculate_total_interest(0.0394, 515000, 30, 'monthly', 0.0414)
+
+
+def test_generate_amortization_grid_matches_amortization():
+    grid = generate_amortization_grid([0.0394, 0.05], 515000, [20, 25.5], 'weekly')
+    for row in grid.itertuples():
+        loan = Amortization(row.nominal_annual_interest_rate, row.principal_amount, row.years, 'weekly')
+        assert row.total_interest == pytest.approx(loan.total_interest, rel=1e-12)
+        assert row.total_payment_per_period == pytest.approx(loan.total_payment_per_period, rel=1e-12)
+    with pytest.raises(ValueError):
+        generate_amortization_grid(0.0394, 515000, 30, 13)